@@ -1,7 +1,12 @@
 from .__version__ import __version__, __date__
 import os
+import sys
 import json
 import copy
+import hashlib
+import math
+import pickle
+import threading
 import warnings
 from typing import Union, TypeVar
 from io import TextIOWrapper
@@ -10,7 +15,8 @@ import base64
 import types
 import re
 import inspect
-from functools import partial
+from functools import partial, lru_cache
+from collections import deque, OrderedDict
 import uuid
 
 try:
@@ -18,6 +24,118 @@ try:
 except ModuleNotFoundError as exc:
     warnings.warn(f"The module requests is not installed. This will break API calls.")
 
+try:
+    from yaml import CSafeLoader as _SafeLoader, CSafeDumper as _SafeDumper
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader, SafeDumper as _SafeDumper
+
+class _RickleLoader(_SafeLoader):
+    # Repeated short scalars (log levels, env names, ...) are interned so that a document keeps one copy of each
+    def construct_yaml_str(self, node):
+        value = super().construct_yaml_str(node)
+        return sys.intern(value) if len(value) < 64 else value
+
+_RickleLoader.add_constructor('tag:yaml.org,2002:str', _RickleLoader.construct_yaml_str)
+
+def _has_non_finite(obj):
+    stack = [obj]
+    while stack:
+        current = stack.pop()
+        if isinstance(current, float):
+            if not math.isfinite(current):
+                return True
+        elif isinstance(current, dict):
+            stack.extend(current.values())
+        elif isinstance(current, (list, tuple)):
+            stack.extend(current)
+    return False
+
+try:
+    import orjson
+
+    def _json_dumps(obj):
+        # orjson rejects ints wider than 64 bit and writes NaN/Infinity as null, json keeps both.
+        # Dates and dataclasses are passed through so that they raise like they do with json
+        try:
+            dumped = orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS |
+                                              orjson.OPT_PASSTHROUGH_DATETIME |
+                                              orjson.OPT_PASSTHROUGH_DATACLASS)
+        except TypeError:
+            return json.dumps(obj).encode('utf-8')
+        if b'null' in dumped and _has_non_finite(obj):
+            return json.dumps(obj).encode('utf-8')
+        return dumped
+except ImportError:
+    def _json_dumps(obj):
+        return json.dumps(obj).encode('utf-8')
+
+def _is_path_candidate(base):
+    # Inline YAML/JSON documents are not stat'ed for being a file path
+    if isinstance(base, str):
+        return len(base) < 4096 and '\n' not in base and '\x00' not in base
+    if isinstance(base, bytes):
+        return len(base) < 4096 and b'\n' not in base and b'\x00' not in base
+    return isinstance(base, os.PathLike)
+
+@lru_cache(maxsize=256)
+def _compile_lambda(load):
+    # Reloading the same config evaluates the same lambda sources; only the first load pays for compiling
+    return compile(load, '<rickle-lambda>', 'eval')
+
+def _substitute(stringed, substitutions):
+    if isinstance(stringed, bytes):
+        substitutions = ((_k.encode(), v.encode()) for _k, v in substitutions)
+    for _k, v in substitutions:
+        stringed = stringed.replace(_k, v)
+    return stringed
+
+def _detect(stringed):
+    head = stringed[:256].lstrip()[:1]
+    if head in ('{', '[', b'{', b'['):
+        return 'json'
+    return 'yaml'
+
+def _load_yaml(stringed):
+    return yaml.load(stringed, Loader=_RickleLoader)
+
+def _parse(stringed):
+    # The parsed document is kept pickled so that every cache hit yields fresh, unshared containers
+    parsers = ((json.loads, ValueError), (_load_yaml, yaml.YAMLError))
+    if _detect(stringed) == 'yaml':
+        parsers = parsers[::-1]
+    for load, error in parsers:
+        try:
+            return pickle.dumps(load(stringed))
+        except error:
+            continue
+    return None
+
+_text_cache = OrderedDict()
+_text_cache_lock = threading.Lock()
+
+def _parse_text(stringed):
+    # Keyed on a digest so that cached documents themselves are not kept alive as keys
+    data = stringed if isinstance(stringed, bytes) else stringed.encode('utf-8', 'surrogatepass')
+    key = (type(stringed), hashlib.blake2b(data, digest_size=16).digest())
+    with _text_cache_lock:
+        parsed = _text_cache.get(key)
+        if parsed is not None:
+            _text_cache.move_to_end(key)
+            return parsed
+    parsed = _parse(stringed)
+    if parsed is not None:
+        with _text_cache_lock:
+            _text_cache[key] = parsed
+            if len(_text_cache) > 128:
+                _text_cache.popitem(last=False)
+    return parsed
+
+@lru_cache(maxsize=128)
+def _parse_file(file_path, mtime, size, substitutions):
+    with open(file_path, 'rb') as fs:
+        data = fs.read()
+    return _parse(_substitute(data, substitutions))
+
 class ObjectRickler:
     """
     A class to convert Python objects to Rickle objects, deconstruct objects, create objects from Rickle objects.
@@ -190,7 +308,7 @@ class ObjectRickler:
             str: Dumped object.
         """
         d = self.deconstruct(obj)
-        return yaml.safe_dump(d, None)
+        return yaml.dump(d, None, Dumper=_SafeDumper)
 
     def to_yaml_file(self, file_path, obj):
         """
@@ -202,7 +320,7 @@ class ObjectRickler:
         """
         d = self.deconstruct(obj)
         with open(file_path, 'w', encoding='utf-8') as fs:
-            yaml.safe_dump(d, fs)
+            yaml.dump(d, fs, Dumper=_SafeDumper)
 
     def to_json_string(self, obj):
         """
@@ -240,42 +358,52 @@ class BaseRickle:
         Raises:
             ValueError: If the given base object can not be handled.
     """
+    # Prefixes of the name mangled private attributes of every Rickle class in the MRO
+    _name_prefix = ('_BaseRickle__',)
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._name_prefix = tuple(f'_{c.__name__}__' for c in cls.__mro__ if issubclass(c, BaseRickle))
+
     def _iternalize(self, dictionary : dict, deep : bool, **init_args):
+        _isinstance, _dict, _list, _Cls = isinstance, dict, list, type(self)
+        if not deep and not any(_isinstance(v, _dict) for v in dictionary.values()):
+            self.__dict__.update(dictionary)
+            return
+
+        out = dict()
         for k, v in dictionary.items():
-            if isinstance(v, dict):
-                self.__dict__.update({k:BaseRickle(v, deep, **init_args)})
+            if _isinstance(v, _dict):
+                out[k] = _Cls(v, deep, **init_args)
                 continue
-            if isinstance(v, list) and deep:
-                new_list = list()
-                for i in v:
-                    if isinstance(i, dict):
-                        new_list.append(BaseRickle(i, deep, **init_args))
-                    else:
-                        new_list.append(i)
-                self.__dict__.update({k: new_list})
+            if _isinstance(v, _list) and deep:
+                out[k] = [_Cls(i, deep, **init_args) if _isinstance(i, _dict) else i for i in v]
                 continue
 
-            self.__dict__.update({k:v})
+            out[k] = v
+        self.__dict__.update(out)
 
     def __init__(self, base : Union[dict,str,TextIOWrapper,list] = None, deep : bool = False, **init_args):
         self.__meta_info = dict()
-        stringed = ''
         if base is None:
             return
         if isinstance(base, dict):
             self._iternalize(base, deep, **init_args)
             return
 
+        substitutions = tuple((f'_|{k}|_', json.dumps(v)) for k, v in init_args.items())
+
         if isinstance(base, TextIOWrapper):
-            stringed = base.read()
+            dict_data = _parse_text(_substitute(base.read(), substitutions))
         elif isinstance(base, list):
+            data = list()
             for file in base:
-                with open(file, 'r') as f:
-                    stringed = f'{stringed}\n{f.read()}'
-        elif os.path.isfile(base):
-            # print('loading file', base)
-            with open(base, 'r') as f:
-                stringed = f.read()
+                with open(file, 'rb') as fs:
+                    data.append(fs.read())
+            dict_data = _parse_text(_substitute(b'\n'.join(data), substitutions))
+        elif _is_path_candidate(base) and os.path.isfile(base):
+            stat = os.stat(base)
+            dict_data = _parse_file(base, stat.st_mtime_ns, stat.st_size, substitutions)
         elif isinstance(base, str):
             from urllib3.util import parse_url
             try:
@@ -290,42 +418,45 @@ class BaseRickle:
             except:
                 pass
 
-            stringed = base
+            dict_data = _parse_text(_substitute(base, substitutions))
+        elif isinstance(base, bytes):
+            dict_data = _parse_text(_substitute(base, substitutions))
+        else:
+            dict_data = None
 
-        if not init_args is None:
-            for k, v in init_args.items():
-                _k = f'_|{k}|_'
-                stringed = stringed.replace(_k,json.dumps(v))
+        if not isinstance(dict_data, bytes):
+            raise ValueError('Base object could not be internalized, type {} not handled'.format(type(base)))
 
-        try:
-            dict_data = yaml.safe_load(stringed)
-            self._iternalize(dict_data, deep, **init_args)
-            return
-        except Exception as exc:
-            print("Tried YAML: {}".format(exc))
-        try:
-            dict_data = json.loads(base)
-            self._iternalize(dict_data, deep, **init_args)
-            return
-        except Exception as exc:
-            print("Tried JSON: {}".format(exc))
+        dict_data = pickle.loads(dict_data)
+        if not isinstance(dict_data, dict):
+            raise ValueError('Base object could not be internalized, type {} not handled'.format(type(base)))
 
+        self._iternalize(dict_data, deep, **init_args)
 
-        raise ValueError('Base object could not be internalized, type {} not handled'.format(type(base)))
+    @staticmethod
+    def clear_cache():
+        """
+        Clears the cache of parsed YAML and JSON documents shared by all Rickles.
+        """
+        with _text_cache_lock:
+            _text_cache.clear()
+        _parse_file.cache_clear()
 
     def __repr__(self):
-        keys = self.__dict__
-        items = ("{}={!r}".format(k, self.__dict__[k]) for k in keys if not str(k).__contains__(self.__class__.__name__) and not str(k).endswith('__meta_info') )
+        items = ("{}={!r}".format(k, v) for k, v in self.__dict__.items() if not self.__eval_name(k))
         return "{}({})".format(type(self).__name__, ", ".join(items))
 
     def __str__(self):
         return self.to_yaml_string()
 
     def __eq__(self, other):
-        return repr(self) == repr(other)
+        if type(self) is not type(other):
+            return False
+        return {k: v for k, v in self.__dict__.items() if not self.__eval_name(k)} == \
+               {k: v for k, v in other.__dict__.items() if not self.__eval_name(k)}
 
     def __setitem__(self, key, item):
-        self.__dict__.update( {key : item} )
+        self.__dict__[key] = item
 
     def __getitem__(self, key):
         return self.__dict__[key]
@@ -334,28 +465,10 @@ class BaseRickle:
         return len(self.__dict__)
 
     def __iter__(self):
-        self.__n = 0
-        return self
-
-    def __next__(self):
-        current_loop = 0
-        if self.__n < len(self.__dict__):
-            name = list(self.__dict__.keys())[self.__n]
-            while self.__eval_name(name) and current_loop < 9:
-                self.__n += 1
-                current_loop += 1
-                if self.__n < len(self.__dict__):
-                    name = list(self.__dict__.keys())[self.__n]
-                else:
-                    raise StopIteration
-            if self.__n < len(self.__dict__):
-                obj = self.__dict__[list(self.__dict__.keys())[self.__n]]
-                self.__n += 1
-                return obj
-            else:
-                raise StopIteration
-        else:
-            raise StopIteration
+        for key, value in self.__dict__.items():
+            if self.__eval_name(key):
+                continue
+            yield value
 
     def __search_path(self, key, dictionary=None, parent_path=None):
         if dictionary is None:
@@ -450,27 +563,23 @@ class BaseRickle:
 
 
     def __eval_name(self, name):
-        if str(name).__contains__(self.__class__.__name__) or str(name).endswith('__n'):
-            return True
-        else:
-            return False
+        return isinstance(name, str) and name.startswith(type(self)._name_prefix)
 
     def _recursive_search(self, dictionary, key):
-        if key in dictionary:
-            return dictionary[key]
-        for k, v in dictionary.items():
-            if isinstance(v, BaseRickle):
-                try:
-                    value = self._recursive_search(v.__dict__, key)
-                    return value
-                except StopIteration:
-                    continue
-            if isinstance(v, dict):
-                try:
-                    value = self._recursive_search(v, key)
-                    return value
-                except StopIteration:
+        queue = deque([dictionary])
+        while queue:
+            current = queue.popleft()
+            if isinstance(current, BaseRickle):
+                mapping, prefix = current.__dict__, type(current)._name_prefix
+            else:
+                mapping, prefix = current, None
+            if key in mapping:
+                return mapping[key]
+            for k, v in mapping.items():
+                if prefix and isinstance(k, str) and k.startswith(prefix):
                     continue
+                if isinstance(v, (BaseRickle, dict)):
+                    queue.append(v)
         raise StopIteration
 
     def items(self):
@@ -480,10 +589,10 @@ class BaseRickle:
         Yields:
             tuple: str, object.
         """
-        for key in self.__dict__.keys():
+        for key, value in self.__dict__.items():
             if self.__eval_name(key):
                 continue
-            yield key, self.__dict__[key]
+            yield key, value
 
     def get(self, key : str, default=None, do_recursive : bool = False):
         """
@@ -499,7 +608,7 @@ class BaseRickle:
         """
         try:
             if do_recursive:
-                value = self._recursive_search(self.__dict__, key)
+                value = self._recursive_search(self, key)
             else:
                 value = self.__dict__.get(key, default)
             return value
@@ -513,10 +622,7 @@ class BaseRickle:
         Returns:
             list: of objects.
         """
-        keys = list(self.__dict__.keys())
-        objects = [self.__dict__[k] for k in keys if not self.__eval_name(k)]
-
-        return objects
+        return [v for k, v in self.__dict__.items() if not self.__eval_name(k)]
 
     def keys(self):
         """
@@ -525,10 +631,7 @@ class BaseRickle:
         Returns:
             list: of keys.
         """
-        keys = list(self.__dict__.keys())
-        keys = [k for k in keys if not self.__eval_name(k)]
-
-        return keys
+        return [k for k in self.__dict__.keys() if not self.__eval_name(k)]
 
     def dict(self, serialised : bool = False):
         """
@@ -544,22 +647,37 @@ class BaseRickle:
             dict: of object.
         """
         d = dict()
+        stack = [(self, d, frozenset())]
+        while stack:
+            node, out, ancestors = stack.pop()
+            if id(node) in ancestors:
+                raise ValueError('Rickle contains a reference to itself and can not be converted to a dict')
+            # Only the nodes on the current path count, the same Rickle may appear in several branches
+            path = ancestors | {id(node)}
+            for key, value in type(node)._dict_items(node, serialised):
+                if isinstance(value, BaseRickle):
+                    child = dict()
+                    stack.append((value, child, path))
+                    out[key] = child
+                elif isinstance(value, list):
+                    new_list = list()
+                    for element in value:
+                        if isinstance(element, BaseRickle):
+                            child = dict()
+                            stack.append((element, child, path))
+                            new_list.append(child)
+                        else:
+                            new_list.append(element)
+                    out[key] = new_list
+                else:
+                    out[key] = value
+        return d
+
+    def _dict_items(self, serialised : bool):
         for key, value in self.__dict__.items():
-            if self.__eval_name(key) or str(key).endswith('__meta_info'):
+            if self.__eval_name(key):
                 continue
-            if isinstance(value, BaseRickle) or isinstance(value, Rickle):
-                d[key] = value.dict(serialised=serialised)
-            elif isinstance(value, list):
-                new_list = list()
-                for element in value:
-                    if isinstance(element, BaseRickle):
-                        new_list.append(element.dict(serialised=serialised))
-                    else:
-                        new_list.append(element)
-                d[key] = new_list
-            else:
-                d[key] = value
-        return d
+            yield key, value
 
     def has(self, key : str, deep=False) -> bool:
         """
@@ -576,7 +694,7 @@ class BaseRickle:
             return True
         if deep:
             try:
-                self._recursive_search(self.__dict__, key)
+                self._recursive_search(self, key)
                 return True
             except StopIteration:
                 return False
@@ -593,9 +711,9 @@ class BaseRickle:
         Notes:
             Functions and lambdas are always given in serialised form.
         """
-        self_as_dict = self.dict(serialised=serialised)
+        dumper = _SerialisedRickleDumper if serialised else _RickleDumper
         with open(file_path, 'w', encoding='utf-8') as fs:
-            yaml.safe_dump(self_as_dict, fs)
+            yaml.dump(self, fs, Dumper=dumper)
 
     def to_yaml_string(self, serialised : bool = True):
         """
@@ -610,8 +728,8 @@ class BaseRickle:
         Returns:
             str: YAML representation.
         """
-        self_as_dict = self.dict(serialised=serialised)
-        return yaml.safe_dump(self_as_dict, None)
+        dumper = _SerialisedRickleDumper if serialised else _RickleDumper
+        return yaml.dump(self, None, Dumper=dumper)
 
     def to_json_file(self, file_path: str, serialised : bool = True):
         """
@@ -623,10 +741,11 @@ class BaseRickle:
 
         Notes:
             Functions and lambdas are always given in serialised form.
+            With `orjson` installed, `uuid.UUID` and `enum.Enum` values are written as their values instead of raising `TypeError`.
         """
         self_as_dict = self.dict(serialised=serialised)
-        with open(file_path, 'w', encoding='utf-8') as fs:
-            json.dump(self_as_dict, fs)
+        with open(file_path, 'wb') as fs:
+            fs.write(_json_dumps(self_as_dict))
 
     def to_json_string(self, serialised : bool = True):
         """
@@ -664,9 +783,25 @@ class BaseRickle:
             name (str): Property name.
             value (any): Value of new member.
         """
-        self.__dict__.update({name: value})
+        self[name] = value
         self.__meta_info[name] = {'type': 'attr', 'value': value}
 
+class _RickleDumper(_SafeDumper):
+    # Rickles are represented node by node, straight from their members, without building the whole dict() first
+    serialised = False
+
+    def ignore_aliases(self, data):
+        # dict() always copied lists and Rickles, so they never shared an anchor
+        return isinstance(data, (BaseRickle, list)) or super().ignore_aliases(data)
+
+class _SerialisedRickleDumper(_RickleDumper):
+    serialised = True
+
+def _represent_rickle(dumper, data):
+    return dumper.represent_dict(dict(type(data)._dict_items(data, dumper.serialised)))
+
+_RickleDumper.add_multi_representer(BaseRickle, _represent_rickle)
+
 class Rickle(BaseRickle):
     """
         An extended version of the BasicRick that can load OS environ variables and Python Lambda functions.
@@ -678,22 +813,24 @@ class Rickle(BaseRickle):
     """
 
     def _iternalize(self, dictionary : dict, deep : bool, **init_args):
+        _Cls = type(self)
         for k, v in dictionary.items():
             if isinstance(v, dict):
-                if 'type' in v.keys() and v['type'] == 'env':
+                type_tag = v.get('type')
+                if type_tag == 'env':
                     self.add_env_variable(name=k,
                                           load=v['load'],
                                           default=v.get('default', None))
                     continue
-                if 'type' in v.keys() and v['type'] == 'base64':
+                if type_tag == 'base64':
                     self.add_base64(name=k,
                                           load=v['load'])
                     continue
-                if 'type' in v.keys() and v['type'] == 'module_import':
+                if type_tag == 'module_import':
                     self.add_module_import(name=k,
                                           imports=v['import'])
                     continue
-                if 'type' in v.keys() and v['type'] == 'from_file':
+                if type_tag == 'from_file':
                     self.add_from_file(name=k,
                                        file_path=v['file_path'],
                                        load_as_rick=v.get('load_as_rick', False),
@@ -703,14 +840,14 @@ class Rickle(BaseRickle):
                                        encoding=v.get('encoding', 'utf-8'),
                                        hot_load=v.get('hot_load', False))
                     continue
-                if 'type' in v.keys() and v['type'] == 'from_csv':
+                if type_tag == 'from_csv':
                     self.add_csv_file(name=k,
                                       file_path=v['file_path'],
                                       fieldnames=v.get('fieldnames', None),
                                       load_as_rick=v.get('load_as_rick', False),
                                       encoding=v.get('encoding', 'utf-8'))
                     continue
-                if 'type' in v.keys() and v['type'] == 'api_json':
+                if type_tag == 'api_json':
                     self.add_api_json_call(name=k,
                                            url=v['url'],
                                            http_verb=v.get('http_verb', 'GET'),
@@ -723,7 +860,7 @@ class Rickle(BaseRickle):
                                            expected_http_status=v.get('expected_http_status', 200),
                                            hot_load=v.get('hot_load', False))
                     continue
-                if 'type' in v.keys() and v['type'] == 'html_page':
+                if type_tag == 'html_page':
                     self.add_html_page(name=k,
                                        url=v['url'],
                                        headers=v.get('headers', None),
@@ -731,7 +868,7 @@ class Rickle(BaseRickle):
                                        expected_http_status=v.get('expected_http_status', 200),
                                        hot_load=v.get('hot_load', False))
                     continue
-                if 'type' in v.keys() and v['type'] == 'lambda':
+                if type_tag == 'lambda':
                     load = v['load']
                     imports = v.get('import', None)
                     safe_load = os.getenv("RICKLE_SAFE_LOAD", None)
@@ -740,9 +877,9 @@ class Rickle(BaseRickle):
                                         load=load,
                                         imports=imports)
                     else:
-                        self.__dict__.update({k: v})
+                        self.__dict__[k] = v
                     continue
-                if 'type' in v.keys() and v['type'] == 'class_definition':
+                if type_tag == 'class_definition':
                     name = v.get('name', k)
                     attributes = v['attributes']
                     imports = v.get('import', None)
@@ -752,9 +889,9 @@ class Rickle(BaseRickle):
                                           attributes=attributes,
                                           imports=imports)
                     else:
-                        self.__dict__.update({k: v})
+                        self.__dict__[k] = v
                     continue
-                if 'type' in v.keys() and v['type'] == 'function':
+                if type_tag == 'function':
                     name = v.get('name', k)
                     load = v['load']
                     args_dict = v.get('args', None)
@@ -769,20 +906,14 @@ class Rickle(BaseRickle):
                                           imports=imports,
                                           is_method=is_method)
                     else:
-                        self.__dict__.update({k: v})
+                        self.__dict__[k] = v
                     continue
-                self.__dict__.update({k:Rickle(v, deep, **init_args)})
+                self.__dict__[k] = _Cls(v, deep, **init_args)
                 continue
             if isinstance(v, list) and deep:
-                new_list = list()
-                for i in v:
-                    if isinstance(i, dict):
-                        new_list.append(Rickle(i, deep, **init_args))
-                    else:
-                        new_list.append(i)
-                self.__dict__.update({k: new_list})
+                self.__dict__[k] = [_Cls(i, deep, **init_args) if isinstance(i, dict) else i for i in v]
                 continue
-            self.__dict__.update({k: v})
+            self.__dict__[k] = v
 
     def __init__(self, base: Union[dict,str,TextIOWrapper,list] = None, deep : bool = False, load_lambda : bool = False, **init_args):
         self.__meta_info = dict()
@@ -792,10 +923,7 @@ class Rickle(BaseRickle):
         super().__init__(base, **init_args)
 
     def __eval_name(self, name):
-        if str(name).__contains__(self.__class__.__name__) or str(name).endswith('__n'):
-            return True
-        else:
-            return False
+        return isinstance(name, str) and name.startswith(type(self)._name_prefix)
 
     def meta(self, name):
         """
@@ -809,45 +937,21 @@ class Rickle(BaseRickle):
         """
         return self.__meta_info[name]
 
-    def dict(self, serialised : bool = False):
-        """
-        Deconstructs the whole object into a Python dictionary.
-
-        Args:
-            serialised (bool): Give a Python dictionary in serialised (True) form or deserialised (default = False).
-
-        Notes:
-            Functions and lambdas are always given in serialised form.
-
-        Returns:
-            dict: of object.
-        """
-        d = dict()
+    def _dict_items(self, serialised : bool):
         for key, value in self.__dict__.items():
             if self.__eval_name(key):
                 continue
             if serialised and key in self.__meta_info.keys():
-                d[key] = self.__meta_info[key]
+                yield key, self.__meta_info[key]
             elif key in self.__meta_info.keys() and \
                     self.__meta_info[key]['type'] in ['function', 'lambda', 'class_definition']:
-                d[key] = self.__meta_info[key]
+                yield key, self.__meta_info[key]
             elif key in self.__meta_info.keys() and \
                     self.__meta_info[key]['type'] in ['from_file', 'html_page', 'api_json'] and \
                     self.__meta_info[key]['hot_load']:
-                d[key] = self.__meta_info[key]
-            elif isinstance(value, BaseRickle):
-                d[key] = value.dict(serialised=serialised)
-            elif isinstance(value, list):
-                new_list = list()
-                for element in value:
-                    if isinstance(element, BaseRickle):
-                        new_list.append(element.dict(serialised=serialised))
-                    else:
-                        new_list.append(element)
-                d[key] = new_list
+                yield key, self.__meta_info[key]
             else:
-                d[key] = value
-        return d
+                yield key, value
 
     def add_module_import(self, name, imports : list):
         """
@@ -937,7 +1041,7 @@ class Rickle(BaseRickle):
         if return_function:
             return eval(func_string)
 
-        self.__dict__.update({name: eval(func_string)})
+        self.__dict__[name] = eval(func_string)
         self.__meta_info[name] = {'type' : 'function', 'name' : name, 'args' : args, 'import' : imports,
                                   'load' : load, 'is_method' : is_method}
 
@@ -979,9 +1083,9 @@ class Rickle(BaseRickle):
             _load = f'lambda: {load}'
 
         if return_lambda:
-            return eval(_load)
+            return eval(_compile_lambda(_load))
 
-        self.__dict__.update({name: eval(_load)})
+        self.__dict__[name] = eval(_compile_lambda(_load))
         self.__meta_info[name] = {'type' : 'lambda', 'import' : imports, 'load' : load}
 
     def add_env_variable(self, name, load, default = None):
@@ -993,7 +1097,7 @@ class Rickle(BaseRickle):
             load (str): ENV var name.
             default (any): Default to value (default = None).
         """
-        self.__dict__.update({name: os.getenv(load, default)})
+        self.__dict__[name] = os.getenv(load, default)
         self.__meta_info[name] = {'type' : 'env', 'load' : load, 'default' : default}
 
     def add_base64(self, name, load):
@@ -1005,7 +1109,7 @@ class Rickle(BaseRickle):
             load (str): Base 64 encoded data.
         """
         b = base64.b64decode(load)
-        self.__dict__.update({name: b})
+        self.__dict__[name] = b
         self.__meta_info[name] = {'type': 'base64',
                                   'load' : load
                                   }
@@ -1058,7 +1162,7 @@ class Rickle(BaseRickle):
                 for row in csv_file:
                     l.append(row)
 
-                self.__dict__.update({name: l})
+                self.__dict__[name] = l
 
         self.__meta_info[name] = {'type': 'from_csv',
                                   'file_path': file_path,
@@ -1124,7 +1228,7 @@ class Rickle(BaseRickle):
                                           is_binary={is_binary},
                                           encoding='{encoding}')"""
 
-            self.__dict__.update({name: eval(_load)})
+            self.__dict__[name] = eval(_compile_lambda(_load))
         else:
             result = self._load_from_file(file_path=file_path,
                                           load_as_rick=load_as_rick,
@@ -1133,7 +1237,7 @@ class Rickle(BaseRickle):
                                           is_binary=is_binary,
                                           encoding=encoding)
 
-            self.__dict__.update({name: result})
+            self.__dict__[name] = result
 
         self.__meta_info[name] = {'type': 'from_file',
                                   'file_path' : file_path,
@@ -1183,14 +1287,14 @@ class Rickle(BaseRickle):
                                           params={params},
                                           expected_http_status={expected_http_status})"""
 
-            self.__dict__.update({name: eval(_load)})
+            self.__dict__[name] = eval(_compile_lambda(_load))
         else:
             result = self._load_html_page(url=url,
                                           headers=headers,
                                           params=params,
                                           expected_http_status=expected_http_status)
 
-            self.__dict__.update({name: result})
+            self.__dict__[name] = result
 
         self.__meta_info[name] = {'type': 'html_page',
                                   'url': url,
@@ -1237,7 +1341,7 @@ class Rickle(BaseRickle):
             _attributes[k] = v
 
 
-        self.__dict__.update({name: type(name,(), _attributes)})
+        self.__dict__[name] = type(name,(), _attributes)
 
         self.__meta_info[name] = {'type' : 'class_definition', 'name' : name, 'import' : imports, 'attributes' : attributes}
 
@@ -1312,7 +1416,7 @@ class Rickle(BaseRickle):
                                 load_lambda={load_lambda},
                                 expected_http_status={expected_http_status})"""
 
-            self.__dict__.update({name: eval(_load)})
+            self.__dict__[name] = eval(_compile_lambda(_load))
         else:
             result = self._load_api_json_call(url=url,
                                                http_verb=http_verb,
@@ -1324,7 +1428,7 @@ class Rickle(BaseRickle):
                                                load_lambda=load_lambda,
                                                expected_http_status=expected_http_status)
 
-            self.__dict__.update({name: result})
+            self.__dict__[name] = result
 
         self.__meta_info[name] = {'type': 'api_json',
                                   'url': url,
@@ -47,7 +47,8 @@ setup(
     package_dir={'.': 'rickled'},
     extras_require={
         'twisted':  ['twisted'],
-        'pyopenssl':  ['pyopenssl']
+        'pyopenssl':  ['pyopenssl'],
+        'orjson':  ['orjson']
     },
     entry_points={
         'console_scripts': [
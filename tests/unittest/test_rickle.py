@@ -49,6 +49,13 @@ class TestPickles(unittest.TestCase):
         self.assertEquals(test_conf_yaml.ONE, "value")
         self.assertEquals(test_conf_json.ONE, "value")
 
+    def test_base_config_path_types(self):
+        import pathlib
+        test_conf = BaseRickle('./tests/placebos/test_config.json')
+
+        self.assertEqual(BaseRickle(b'./tests/placebos/test_config.json'), test_conf)
+        self.assertEqual(BaseRickle(pathlib.Path('./tests/placebos/test_config.json')), test_conf)
+
     def test_base_config_add_attr(self):
         test_conf = BaseRickle()
 
@@ -126,6 +133,65 @@ class TestPickles(unittest.TestCase):
         self.assertIsInstance(value, BaseRickle)
         self.assertEquals(value.type, 'env')
 
+    def test_config_get_search_breadth_first(self):
+        test_dict = {'A': {'B': {'key': 'deep'}}, 'C': {'key': 0}}
+        test_conf = BaseRickle(test_dict)
+
+        self.assertEqual(test_conf.get('key', do_recursive=True), 0)
+        self.assertTrue(test_conf.has('key', deep=True))
+
+    def test_config_equality(self):
+        test_dict = {'A': 1, 'B': {'k': [1, 2]}}
+
+        self.assertEqual(BaseRickle(test_dict), BaseRickle(test_dict))
+        self.assertNotEqual(BaseRickle(test_dict), BaseRickle({'A': 1, 'B': {'k': [1]}}))
+        self.assertNotEqual(BaseRickle(test_dict), Rickle(test_dict))
+
+        test_conf = BaseRickle()
+        test_conf.add_attr('A', 1)
+
+        self.assertEqual(test_conf, BaseRickle({'A': 1}))
+
+        test_dict = {'items': [1, 2], 'keys': 'k'}
+
+        self.assertEqual(Rickle(test_dict), Rickle(test_dict))
+        self.assertNotEqual(Rickle(test_dict), Rickle({'items': [1], 'keys': 'k'}))
+
+    def test_config_get_search_after_update(self):
+        test_conf = BaseRickle({'A': {'B': {'key': 1}}})
+
+        self.assertEqual(test_conf.get('key', do_recursive=True), 1)
+
+        test_conf.A.B['key'] = 2
+
+        self.assertEqual(test_conf.get('key', do_recursive=True), 2)
+
+        test_conf.A['key'] = 5
+
+        self.assertEqual(test_conf.get('key', do_recursive=True), 5)
+
+        test_conf.key = 3
+
+        self.assertEqual(test_conf.get('key', do_recursive=True), 3)
+
+        test_conf = Rickle({'A': {'B': {'key': 1}}})
+        test_conf.get('key', do_recursive=True)
+        test_conf.add_env_variable('key', 'RICKLE_UNSET_TEST_VARIABLE', default='env')
+
+        self.assertEqual(test_conf.get('key', do_recursive=True), 'env')
+
+        test_conf = BaseRickle({'A': {'B': {'key': 1}}})
+        test_conf.has('key', deep=True)
+        test_conf.A = BaseRickle({'C': {'other': 4}})
+
+        self.assertFalse(test_conf.has('key', deep=True))
+
+    def test_config_get_search_method_named_keys(self):
+        test_conf = Rickle({'values': [1, 2], 'items': 'i', 'sub': {'x': 1}})
+
+        self.assertEqual(test_conf.get('x', do_recursive=True), 1)
+        self.assertTrue(test_conf.has('x', deep=True))
+
     def test_config_to_dict(self):
         test_dict = {'user': {
             'type': 'env',
@@ -141,6 +207,19 @@ class TestPickles(unittest.TestCase):
 
         self.assertDictEqual(test_conf.dict(), test_dict)
 
+    def test_config_to_dict_references(self):
+        shared = BaseRickle({'x': 1})
+        test_conf = BaseRickle({'a': 1})
+        test_conf.add_attr('first', shared)
+        test_conf.add_attr('second', [shared])
+
+        self.assertDictEqual(test_conf.dict(), {'a': 1, 'first': {'x': 1}, 'second': [{'x': 1}]})
+
+        test_conf.add_attr('me', test_conf)
+
+        with self.assertRaises(ValueError):
+            test_conf.dict()
+
     def test_config_keys(self):
         test_dict = {'user': {
             'type': 'env',
@@ -157,6 +236,26 @@ class TestPickles(unittest.TestCase):
         for k in test_conf.keys():
             self.assertIn(k, ['user', 'func'])
 
+    def test_config_keys_with_class_name(self):
+        test_dict = {'Rickle': 1, 'BaseRickle_key': 2}
+
+        test_conf = Rickle(test_dict)
+
+        self.assertListEqual(test_conf.keys(), ['Rickle', 'BaseRickle_key'])
+        self.assertListEqual(test_conf.values(), [1, 2])
+        self.assertDictEqual(test_conf.dict(), test_dict)
+
+    def test_config_method_named_keys(self):
+        test_dict = {'items': [1, 2], 'keys': 'k', 'values': {'x': 1}, 'sub': {'x': 2}}
+
+        for cls in (BaseRickle, Rickle):
+            test_conf = cls(test_dict)
+
+            self.assertDictEqual(test_conf.dict(), test_dict)
+            self.assertIn('items', test_conf.to_yaml_string())
+            self.assertIn('"keys": "k"', test_conf.to_json_string())
+            self.assertIn('items', str(test_conf))
+
     def test_config_iterator(self):
         test_dict = {'user': {
             'hello' : 'world'
@@ -171,6 +270,13 @@ class TestPickles(unittest.TestCase):
         for k in test_conf:
             self.assertEquals(k.hello, 'world')
 
+    def test_config_nested_iterators(self):
+        test_conf = BaseRickle({'a': 1, 'b': 2})
+
+        pairs = [(x, y) for x in test_conf for y in test_conf]
+
+        self.assertListEqual(pairs, [(1, 1), (1, 2), (2, 1), (2, 2)])
+
     def test_config_has_key(self):
         test_dict = {'user': {
             'hello' : 'world'
@@ -268,6 +374,35 @@ class TestPickles(unittest.TestCase):
 
         os.remove(filename)
 
+    def test_json_large_int_and_nan(self):
+        import math
+        test_conf = BaseRickle('{"big": 123456789012345678901234567890, "nan": NaN, "none": null}')
+
+        self.assertEqual(test_conf.big, 123456789012345678901234567890)
+        self.assertTrue(math.isnan(test_conf.nan))
+
+        filename = './unit_test_file_numbers.json'
+
+        test_conf.to_json_file(filename)
+        reloaded = BaseRickle(filename)
+        os.remove(filename)
+
+        self.assertEqual(reloaded.big, 123456789012345678901234567890)
+        self.assertTrue(math.isnan(reloaded.nan))
+        self.assertIsNone(reloaded.none)
+
+    def test_json_dump_yaml_date(self):
+        test_conf = BaseRickle('d: 2020-01-01\n')
+        filename = './unit_test_file_date.json'
+
+        with self.assertRaises(TypeError):
+            test_conf.to_json_string()
+        with self.assertRaises(TypeError):
+            test_conf.to_json_file(filename)
+
+        if os.path.isfile(filename):
+            os.remove(filename)
+
     def test_extended_config_add_function(self):
         import math
         test_conf = Rickle()
@@ -386,4 +521,58 @@ def tester(x, c):
 
         r = Rickle(url)
 
-        self.assertTrue(True)
\ No newline at end of file
+        self.assertTrue(True)
+
+    def test_parse_cache(self):
+        BaseRickle.clear_cache()
+        filename = './unit_test_cache.yaml'
+        with open(filename, 'w') as fs:
+            fs.write('A: [1, 2]\n')
+
+        first = BaseRickle(filename)
+        first.A.append(3)
+        second = BaseRickle(filename)
+
+        self.assertListEqual(second.A, [1, 2])
+
+        with open(filename, 'w') as fs:
+            fs.write('A: [1, 2, 3, 4]\n')
+
+        third = BaseRickle(filename)
+
+        self.assertListEqual(third.A, [1, 2, 3, 4])
+
+        os.remove(filename)
+
+    def test_load_bytes_document(self):
+        test_conf = BaseRickle(b'{"a": 1}')
+        self.assertEqual(test_conf.a, 1)
+
+        test_conf = BaseRickle(b'b: [_|x|_]\n', x=2)
+        self.assertEqual(test_conf.b, [2])
+
+    def test_parse_cache_text(self):
+        BaseRickle.clear_cache()
+        yaml_string = 'A: [1, 2]\nB: {C: [3]}\n'
+
+        first = BaseRickle(yaml_string)
+        first.A.append(3)
+        first.B.C.append(4)
+        second = BaseRickle(yaml_string)
+
+        self.assertListEqual(second.A, [1, 2])
+        self.assertListEqual(second.B.C, [3])
+
+        filename = './unit_test_cache_stream.yaml'
+        with open(filename, 'w') as fs:
+            fs.write(yaml_string)
+
+        with open(filename, 'r') as fs:
+            first = BaseRickle(fs)
+        first.A.append(3)
+        with open(filename, 'r') as fs:
+            second = BaseRickle(fs)
+
+        self.assertListEqual(second.A, [1, 2])
+
+        os.remove(filename)